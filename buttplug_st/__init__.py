@@ -1,9 +1,17 @@
 """
 ButtplugST - Bridge between SillyTavern and buttplug.io devices
 """
+from ._lazy import lazy_getattr
 
 __version__ = "0.1.0"
 
-from .config import Settings
-from .core import DeviceManager, DeviceInfo
-from .api import create_blueprint 
\ No newline at end of file
+__all__ = ["Settings", "DeviceManager", "DeviceInfo", "create_blueprint"]
+
+# Public names are imported on first access, so entry points that only need
+# one submodule (e.g. the standalone scripts) don't load pydantic and the API
+__getattr__ = lazy_getattr(globals(), {
+    "Settings": ".config",
+    "DeviceManager": ".core",
+    "DeviceInfo": ".core",
+    "create_blueprint": ".api",
+})
\ No newline at end of file
@@ -0,0 +1,202 @@
+"""
+Minimal Quart apps behind the standalone simple-script*.py entry points
+
+Unlike buttplug_st.app these talk to the first device found at startup and
+answer in plain text.
+"""
+import asyncio
+import logging
+import os
+from functools import lru_cache
+from typing import Literal, Optional
+
+from buttplug.client import (
+    Client as ButtplugClient,
+    Device as ButtplugClientDevice
+)
+from buttplug.connectors import WebsocketConnector
+from quart import Quart, Response, request
+
+from .core.commands import CommandBatcher
+from .event_loop import install_uvloop
+from .core.exceptions import ValidationError
+from .utils.validators import clamp01, parse_float
+
+logger = logging.getLogger(__name__)
+
+# "combined": /vibrate sends speed and position in one actuator command
+# "separate": /vibrate sends speed only, /linear moves a linear actuator
+AppMode = Literal["combined", "separate"]
+
+WEBSOCKET_URL = "ws://127.0.0.1:12345"
+
+# Seconds to wait for the first device while scanning
+SCAN_TIMEOUT = 2.0
+SCAN_POLL_INTERVAL = 0.05
+
+# Vibrate commands arriving within this window are coalesced into one send
+BATCH_WINDOW = 0.02
+
+# Pre-encoded bodies for the constant responses
+_NOT_READY = b"Device not ready"
+_ACTUATOR_NOT_READY = b"Device or actuator not ready"
+_STOPPED = b"Device stopped"
+
+def _text_response(body: bytes, status: int = 200) -> Response:
+    """Build a plain text response; Response objects are mutable and never shared"""
+    return Response(body, status, mimetype="text/plain")
+
+@lru_cache(maxsize=128)
+def _vibrate_message(speed: float, position: Optional[float], duration: float) -> bytes:
+    """Encoded success message for a vibrate command"""
+    message = "Vibrating at %.0f%% power" % (speed * 100)
+    if position is not None:
+        message += ", position %.0f%%" % (position * 100)
+    if duration > 0:
+        message += " for %s seconds" % duration
+    return message.encode()
+
+
+class _DeviceBridge:
+    """Connection to the first Intiface device, with command coalescing and a timed stop"""
+
+    def __init__(self) -> None:
+        self.client: Optional[ButtplugClient] = None
+        self.device: Optional[ButtplugClientDevice] = None
+        self._commands = CommandBatcher(BATCH_WINDOW)
+
+    async def setup(self) -> None:
+        """Connect to Intiface and pick the first device"""
+        self.client = ButtplugClient("QuartButtplugClient")
+        await self.client.connect(WebsocketConnector(WEBSOCKET_URL))
+
+        # buttplug-py has no device-added hook, so poll until the first
+        # device shows up instead of always waiting out the full timeout
+        await self.client.start_scanning()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SCAN_TIMEOUT
+        while not self.client.devices and loop.time() < deadline:
+            await asyncio.sleep(SCAN_POLL_INTERVAL)
+        await self.client.stop_scanning()
+
+        if not self.client.devices:
+            raise Exception("No devices found!")
+
+        self.device = self.client.devices[0]
+        logger.info("Connected to device: %s", self.device.name)
+
+    def queue_vibrate(self, speed: float, position: Optional[float], duration: float) -> None:
+        """Queue a vibrate command on the first actuator"""
+        self._commands.submit(self.device.actuators[0], speed, position, duration)
+
+    async def stop(self) -> None:
+        """Drop queued commands and stop the device"""
+        self._commands.cancel()
+        await self.device.stop()
+
+
+def make_app(mode: AppMode) -> Quart:
+    """
+    Create a standalone Quart app driving the first Intiface device
+
+    Args:
+        mode: "combined" to send speed and position together on /vibrate,
+            "separate" for speed-only /vibrate plus a /linear endpoint
+
+    Returns:
+        Configured Quart application instance
+    """
+    if mode not in ("combined", "separate"):
+        raise ValueError(f"Unknown app mode: {mode!r}")
+
+    app = Quart(__name__)
+    bridge = _DeviceBridge()
+
+    # Connect once at startup; requests never check for initialization
+    @app.before_serving
+    async def initialize():
+        await bridge.setup()
+
+    @app.route("/vibrate")
+    async def vibrate():
+        logger.debug("Vibrate endpoint called")
+        device = bridge.device
+        if not device or not device.actuators:
+            logger.debug("Device or actuator not ready")
+            return _text_response(_ACTUATOR_NOT_READY, 500)
+
+        try:
+            args = request.args
+            speed = clamp01(parse_float(args.get("speed"), 0.5, "speed"))
+            position = None
+            if mode == "combined":
+                position = clamp01(parse_float(args.get("position"), 0.0, "position"))
+            duration = parse_float(args.get("duration"), 0.0, "duration")  # seconds (0 = no limit)
+
+            logger.debug("Sending vibrate command at speed %s, position %s for %s seconds", speed, position, duration)
+            bridge.queue_vibrate(speed, position, duration)
+
+            return _text_response(_vibrate_message(speed, position, duration))
+        except ValidationError as e:
+            return _text_response(e.detail.encode(), 400)
+        except Exception as e:
+            logger.error("Exception: %s", e)
+            return _text_response(str(e).encode(), 500)
+
+    @app.route("/stop")
+    async def stop():
+        if not bridge.device:
+            return _text_response(_NOT_READY, 500)
+
+        try:
+            await bridge.stop()
+            return _text_response(_STOPPED)
+        except Exception as e:
+            return _text_response(str(e).encode(), 500)
+
+    if mode == "separate":
+        @app.route("/linear")
+        async def linear():
+            device = bridge.device
+            if not device:
+                return _text_response(_NOT_READY, 500)
+            if not device.linear_actuators:
+                return _text_response(_ACTUATOR_NOT_READY, 500)
+
+            try:
+                args = request.args
+                position = clamp01(parse_float(args.get("position"), 0.5, "position"))
+                duration = args.get("duration")
+                duration = 1000 if duration is None else int(duration)
+                await device.linear_actuators[0].command(duration, position)
+                message = "Moving to position %.0f%% over %dms" % (position * 100, duration)
+                return _text_response(message.encode())
+            except ValidationError as e:
+                return _text_response(e.detail.encode(), 400)
+            except Exception as e:
+                return _text_response(str(e).encode(), 500)
+
+    app.bridge = bridge
+    return app
+
+
+def run_app(app: Quart, host: str = "localhost", port: int = 3069) -> None:
+    """Serve a standalone app with Hypercorn, or the Quart dev server when DEV is set"""
+    install_uvloop()
+
+    # Per-request messages are debug level; DEV=1 shows them. This module
+    # stays at INFO so the device picked at startup is always reported
+    dev = os.environ.get("DEV")
+    logging.basicConfig(level=logging.DEBUG if dev else logging.WARNING)
+    logger.setLevel(logging.DEBUG if dev else logging.INFO)
+
+    if dev:
+        app.run(host=host, port=port)
+    else:
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+
+        config = Config()
+        config.bind = [f"{host}:{port}"]
+        config.keep_alive_timeout = 30
+        asyncio.run(serve(app, config))
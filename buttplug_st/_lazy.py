@@ -0,0 +1,26 @@
+import importlib
+from typing import Any, Callable, Dict
+
+
+def lazy_getattr(namespace: Dict[str, Any], attrs: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a package __getattr__ that imports its exports on first access
+
+    Args:
+        namespace: The package's globals(); resolved names are cached there
+        attrs: Exported name -> relative module that defines it
+
+    Returns:
+        Function to assign to the package's module-level __getattr__
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        module_name = attrs.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
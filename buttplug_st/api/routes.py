@@ -2,14 +2,13 @@ import logging
 from typing import Tuple, Dict, Any, Optional
 from functools import wraps
 
+import orjson
 from quart import Blueprint, request, jsonify
-from pydantic import ValidationError as PydanticValidationError
 
 from ..core.device import DeviceManager
-from ..core.exceptions import ButtplugSTException
+from ..core.exceptions import ButtplugSTException, ValidationError
+from ..utils.validators import clamp01, parse_bool, parse_float
 from .schemas import (
-    VibrateRequest, 
-    DeviceSelectionRequest,
     APIResponse,
     ErrorResponse
 )
@@ -29,13 +28,6 @@ def create_blueprint(device_manager: DeviceManager) -> Blueprint:
         async def decorated_function(*args, **kwargs):
             try:
                 return await f(*args, **kwargs)
-            except PydanticValidationError as e:
-                logger.error(f"Validation error: {e}")
-                return jsonify(ErrorResponse(
-                    error="validation_error",
-                    detail=str(e),
-                    status_code=400
-                ).dict()), 400
             except ButtplugSTException as e:
                 logger.error(f"ButtplugST error: {e}")
                 return jsonify(e.to_dict()), e.status_code
@@ -45,172 +37,132 @@ def create_blueprint(device_manager: DeviceManager) -> Blueprint:
                     error="internal_error",
                     detail=str(e),
                     status_code=500
-                ).dict()), 500
+                )), 500
         return decorated_function
     
     # Ensure device manager is initialized
     @api_bp.before_request
     async def ensure_initialized():
-        logger.info(f"Request received: {request.path}")
-        
-        try:
-            if not api_bp.device_manager._initialized:
+        # Fast path: nothing to do while ready and still connected; a dropped
+        # connection is retried here rather than at the next background scan
+        device_manager = api_bp.device_manager
+        if not device_manager._ready.is_set() or not device_manager.is_connected:
+            try:
                 logger.info("Device manager not initialized, initializing now...")
-                await api_bp.device_manager.initialize()
+                await device_manager.initialize()
                 logger.info("Device manager initialization complete")
-        except Exception as e:
-            logger.error(f"Error during initialization: {e}")
-            # Don't raise here, let the endpoint handle the error
-        
-        # Skip device check for status endpoint
-        if request.path == "/status":
-            return
-        
-        # For other endpoints, check if device is available
-        if not api_bp.device_manager.has_devices:
-            try:
-                # Try scanning for devices if none are available
-                logger.info("No devices available, scanning...")
-                await api_bp.device_manager.scan_devices()
-                logger.info(f"Device scan complete. Found {len(api_bp.device_manager._devices)} devices.")
             except Exception as e:
-                logger.error(f"Error scanning for devices: {e}")
+                logger.error(f"Error during initialization: {e}")
                 # Don't raise here, let the endpoint handle the error
     
     @api_bp.route("/status")
     @handle_errors
     async def status() -> Tuple[Dict[str, Any], int]:
         """Get server and device status"""
-        logger.info("Status endpoint called")
-        
-        is_connected = api_bp.device_manager.is_connected
-        has_devices = api_bp.device_manager.has_devices
-        active_device = api_bp.device_manager.get_active_device()
-        initialized = api_bp.device_manager._initialized
-        
-        # Get more details
-        client_state = "Not created"
-        if api_bp.device_manager._client is not None:
-            client_state = "Connected" if api_bp.device_manager._client.connected else "Disconnected"
-            
-        device_count = len(api_bp.device_manager._devices)
-        
-        status_data = {
-            "status": "ok" if is_connected else "error",
-            "server_running": True,
-            "server_initialized": initialized,
-            "intiface_connected": is_connected,
-            "client_state": client_state,
-            "device_count": device_count,
-            "has_devices": has_devices,
-            "websocket_url": api_bp.device_manager.settings.websocket.url,
-            "active_device": None if not active_device else {
-                "id": active_device.id,
-                "name": active_device.name,
-                "index": active_device.index,
-                "actuator_count": active_device.actuator_count,
-                "actuator_types": active_device.actuator_types
-            }
-        }
+        logger.debug("Status endpoint called")
         
-        logger.info(f"Status response: {status_data}")
+        status_data = api_bp.device_manager.get_status()
+        
+        logger.debug("Status response: %s", status_data)
         
         return jsonify(APIResponse(
             success=True,
             message="Server status",
             data=status_data
-        ).dict()), 200
+        )), 200
     
     @api_bp.route("/devices")
     @handle_errors
     async def list_devices() -> Tuple[Dict[str, Any], int]:
         """Get list of connected devices"""
-        # Scan for devices
-        await api_bp.device_manager.scan_devices()
+        # Rescan only when the device list is stale, unless forced
+        if parse_bool(request.args.get("force"), False, "force"):
+            await api_bp.device_manager.scan_devices()
+        else:
+            await api_bp.device_manager.scan_devices_if_stale()
         
-        devices = api_bp.device_manager.get_all_devices()
+        device_list = api_bp.device_manager._device_info_dicts
         active_index = api_bp.device_manager._active_device_index
         
-        device_list = [{
-            "id": d.id,
-            "name": d.name,
-            "index": d.index,
-            "actuator_count": d.actuator_count,
-            "actuator_types": d.actuator_types
-        } for d in devices]
-        
         return jsonify(APIResponse(
             success=True,
-            message=f"Found {len(devices)} devices",
+            message=f"Found {len(device_list)} devices",
             data={
                 "devices": device_list,
                 "active_index": active_index
             }
-        ).dict()), 200
+        )), 200
     
     @api_bp.route("/device", methods=["POST"])
     @handle_errors
     async def select_device() -> Tuple[Dict[str, Any], int]:
         """Select active device by index"""
-        data = await request.get_json()
-        req = DeviceSelectionRequest.parse_obj(data)
+        try:
+            data = orjson.loads(await request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            raise ValidationError("Request body must be valid JSON")
+        
+        index = data.get("index") if isinstance(data, dict) else None
+        # Accept the forms the old pydantic model coerced: 1, 1.0 and "1"
+        if type(index) is float and index.is_integer():
+            index = int(index)
+        elif type(index) is str:
+            try:
+                index = int(index)
+            except ValueError:
+                pass
+        if type(index) is not int or index < 0:
+            raise ValidationError("Parameter 'index' must be a non-negative integer")
         
-        device_info = api_bp.device_manager.set_active_device(req.index)
+        device_info = api_bp.device_manager.set_active_device(index)
         
         return jsonify(APIResponse(
             success=True,
             message=f"Selected device: {device_info.name}",
-            data={
-                "id": device_info.id,
-                "name": device_info.name,
-                "index": device_info.index,
-                "actuator_count": device_info.actuator_count,
-                "actuator_types": device_info.actuator_types
-            }
-        ).dict()), 200
+            data=api_bp.device_manager._device_info_dicts[device_info.index]
+        )), 200
     
     @api_bp.route("/vibrate")
     @handle_errors
     async def vibrate() -> Tuple[Dict[str, Any], int]:
         """Control vibration of the active device"""
         # Add detailed logging for incoming request
-        logger.info(f"Vibrate endpoint called with args: {request.args}")
+        logger.debug("Vibrate endpoint called with args: %s", request.args)
         
-        # Parse query parameters
-        speed = float(request.args.get("speed", 0.5))
-        position = request.args.get("position")
-        position = float(position) if position is not None else None
-        duration = float(request.args.get("duration", 0))
+        # Parse query parameters; malformed values are rejected, not defaulted
+        args = request.args
+        speed = parse_float(args.get("speed"), 0.5, "speed")
+        position = parse_float(args.get("position"), None, "position")
+        duration = parse_float(args.get("duration"), 0.0, "duration")
         
-        logger.info(f"Parsed parameters - speed: {speed}, position: {position}, duration: {duration}")
+        logger.debug("Parsed parameters - speed: %s, position: %s, duration: %s", speed, position, duration)
         
-        # Validate using Pydantic model
-        req = VibrateRequest(
-            speed=speed,
-            position=position,
-            duration=duration
-        )
+        # Clamp directly; the device manager applies the same bounds
+        speed = clamp01(speed)
+        if position is not None:
+            position = clamp01(position)
+        duration = max(0.0, duration)
         
         # Execute vibration command
         result = await api_bp.device_manager.vibrate(
-            speed=req.speed,
-            position=req.position,
-            duration=req.duration
+            speed=speed,
+            position=position,
+            duration=duration
         )
         
-        message = f"Vibrating at {req.speed*100:.0f}% power"
-        if req.position is not None:
-            message += f", position {req.position*100:.0f}%"
-        if req.duration > 0:
-            message += f" for {req.duration} seconds"
+        message = f"Vibrating at {speed*100:.0f}% power"
+        if position is not None:
+            message += f", position {position*100:.0f}%"
+        if duration > 0:
+            message += f" for {duration} seconds"
         
-        logger.info(f"Vibrate command completed: {message}")
+        logger.info("Vibrate command completed: %s", message)
         
         return jsonify(APIResponse(
             success=True,
             message=message,
             data=result
-        ).dict()), 200
+        )), 200
     
     @api_bp.route("/stop")
     @handle_errors
@@ -222,7 +174,7 @@ def create_blueprint(device_manager: DeviceManager) -> Blueprint:
             success=True,
             message="Device stopped",
             data=result
-        ).dict()), 200
+        )), 200
     
     @api_bp.route("/scan")
     @handle_errors
@@ -235,14 +187,8 @@ def create_blueprint(device_manager: DeviceManager) -> Blueprint:
             message=f"Found {len(devices)} devices",
             data={
                 "count": len(devices),
-                "devices": [{
-                    "id": d.id,
-                    "name": d.name,
-                    "index": d.index,
-                    "actuator_count": d.actuator_count,
-                    "actuator_types": d.actuator_types
-                } for d in devices]
+                "devices": api_bp.device_manager._device_info_dicts
             }
-        ).dict()), 200
+        )), 200
     
     return api_bp 
\ No newline at end of file
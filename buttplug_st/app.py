@@ -7,13 +7,17 @@ from functools import partial
 import signal
 from typing import Callable, Optional, Dict, Any
 
+from hypercorn.asyncio import serve
+from hypercorn.config import Config as HypercornConfig
 from quart import Quart, jsonify, Response
 from quart_cors import cors
 
 from .config import Settings
+from .event_loop import install_uvloop
 from .core import DeviceManager
 from .core.exceptions import ButtplugSTException
 from .api import create_blueprint
+from .utils import OrjsonProvider
 
 # Configure logging
 logging.basicConfig(
@@ -34,6 +38,13 @@ def create_app(settings: Settings) -> Quart:
     """
     app = Quart(__name__)
     
+    # Per-request debug messages are only emitted in debug mode
+    if settings.server.debug:
+        logging.getLogger("buttplug_st").setLevel(logging.DEBUG)
+    
+    # Serialize responses with orjson
+    app.json = OrjsonProvider(app)
+    
     # Enable CORS
     app = cors(app, allow_origin="*")
     
@@ -81,28 +92,53 @@ def create_app(settings: Settings) -> Quart:
     app.device_manager = device_mgr
     return app
 
-def handle_signal(app: Quart, loop: asyncio.AbstractEventLoop, signal_name: str) -> None:
+def handle_signal(shutdown_event: asyncio.Event, signal_name: str) -> None:
     """
     Handle termination signals
     
     Args:
-        app: The Quart application
-        loop: Event loop running the application
+        shutdown_event: Event that stops the server once set
         signal_name: Name of the received signal
     """
     logger.info(f"Received {signal_name}, shutting down...")
-    loop.create_task(app.shutdown())
+    shutdown_event.set()
+
+def create_server_config(settings: Settings) -> HypercornConfig:
+    """
+    Create the Hypercorn configuration for serving the application
+    
+    Args:
+        settings: Application settings
+        
+    Returns:
+        Hypercorn configuration
+    """
+    config = HypercornConfig()
+    config.bind = [f"{settings.server.host}:{settings.server.port}"]
+    config.access_log_format = "%(h)s %(r)s %(s)s %(b)s %(D)s"
+    config.accesslog = logging.getLogger("hypercorn.access")
+    config.errorlog = logging.getLogger("hypercorn.error")
+    # Keep idle client connections open between polls (Hypercorn's default is 5 s)
+    config.keep_alive_timeout = 30
+    return config
 
-async def main() -> None:
-    """Main application entry point"""
+async def main(settings: Optional[Settings] = None) -> None:
+    """
+    Main application entry point
+    
+    Args:
+        settings: Application settings, loaded from the default config if omitted
+    """
     # Load settings
-    settings = Settings.load()
+    if settings is None:
+        settings = Settings.load()
     
     # Create the application
     app = create_app(settings)
     
     # Set up signal handlers for graceful shutdown
     loop = asyncio.get_running_loop()
+    shutdown_event = asyncio.Event()
     
     # Skip signal handlers on Windows as they're not supported
     if platform.system() != "Windows":
@@ -112,18 +148,20 @@ async def main() -> None:
                     sig = getattr(signal, sig_name)
                     loop.add_signal_handler(
                         sig,
-                        partial(handle_signal, app, loop, sig_name)
+                        partial(handle_signal, shutdown_event, sig_name)
                     )
         except NotImplementedError:
             logger.warning("Signal handlers not supported on this platform")
     
     # Start the server
     logger.info(f"Starting server on {settings.server.host}:{settings.server.port}")
-    await app.run_task(
-        host=settings.server.host,
-        port=settings.server.port,
-        debug=settings.server.debug
+    app.debug = settings.server.debug
+    await serve(
+        app,
+        create_server_config(settings),
+        shutdown_trigger=shutdown_event.wait
     )
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main()) 
\ No newline at end of file
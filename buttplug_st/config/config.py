@@ -1,20 +1,30 @@
 import os
-import tomli
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Optional, Dict, Tuple, Any, FrozenSet, Iterable, Callable, get_args
+from pydantic import BaseModel, ConfigDict, Field
 
 class Settings(BaseModel):
+    # Loaded settings are shared through a cache, so they are immutable
+    model_config = ConfigDict(frozen=True)
+    
     class Server(BaseModel):
+        model_config = ConfigDict(frozen=True)
+        
         host: str = Field("localhost", description="Server host")
         port: int = Field(3069, description="Server port")
         debug: bool = Field(False, description="Debug mode")
 
     class Websocket(BaseModel):
+        model_config = ConfigDict(frozen=True)
+        
         url: str = Field("ws://127.0.0.1:12345", description="Intiface websocket URL")
         scan_timeout: int = Field(2, description="Device scan timeout in seconds")
+        scan_interval: float = Field(30.0, description="Seconds between background device scans")
         
     class Device(BaseModel):
+        model_config = ConfigDict(frozen=True)
+        
         default_speed: float = Field(0.5, description="Default vibration speed")
         default_position: float = Field(0.5, description="Default position for linear movement")
         default_duration: float = Field(0.0, description="Default duration in seconds (0 = no limit)")
@@ -31,24 +41,87 @@ class Settings(BaseModel):
             base_dir = Path(__file__).parent
             config_path = os.path.join(base_dir, "default.toml")
         
-        # Load from file if exists
-        if os.path.exists(config_path):
-            with open(config_path, "rb") as f:
-                config_data = tomli.load(f)
-            settings = cls.parse_obj(config_data)
-        else:
-            settings = cls()
+        # Load from file if exists, reparsing only when it has changed
+        config_data: Dict[str, Any] = {}
+        try:
+            mtime = os.stat(config_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None:
+            config_data = _read_toml(os.path.abspath(config_path), mtime)
+        
+        # Flatten known fields to (section, key) -> value
+        values = {
+            (section, key): value
+            for section, section_data in config_data.items() if isinstance(section_data, dict)
+            for key, value in section_data.items() if (section, key) in _KNOWN_FIELDS
+        }
             
         # Override with environment variables
         # Format: BUTTPLUG_SERVER_HOST, BUTTPLUG_WEBSOCKET_URL, etc.
-        for env_name, env_value in os.environ.items():
-            if env_name.startswith("BUTTPLUG_"):
-                parts = env_name.lower().split("_")[1:]  # Remove BUTTPLUG_ prefix
-                if len(parts) >= 2:
-                    section, key = parts[0], "_".join(parts[1:])
-                    if hasattr(settings, section) and hasattr(getattr(settings, section), key):
-                        section_obj = getattr(settings, section)
-                        field_type = type(getattr(section_obj, key))
-                        setattr(section_obj, key, field_type(env_value))
+        for env_name, (section, key, caster) in _ENV_MAP.items():
+            env_value = os.environ.get(env_name)
+            if env_value is not None:
+                values[(section, key)] = caster(env_value)
         
-        return settings 
\ No newline at end of file
+        try:
+            frozen = frozenset(values.items())
+        except TypeError:
+            # Unhashable values (e.g. a TOML array) can't be memoized;
+            # validate uncached and let pydantic report them
+            return _build_settings(values.items())
+        return _settings_from_frozen(frozen)
+
+
+@lru_cache(maxsize=4)
+def _read_toml(config_path: str, mtime: int) -> Dict[str, Any]:
+    """Parse a TOML file, memoized on its path and modification time"""
+    # Only pay for the TOML parser when there is a file to read
+    try:
+        import tomllib as toml
+    except ImportError:  # Python < 3.11
+        import tomli as toml
+    with open(config_path, "rb") as f:
+        return toml.load(f)
+
+
+def _build_settings(items: Iterable[Tuple[Tuple[str, str], Any]]) -> Settings:
+    """Validate flattened (section, key) settings values"""
+    config_data: Dict[str, Dict[str, Any]] = {}
+    for (section, key), value in items:
+        config_data.setdefault(section, {})[key] = value
+    return Settings.model_validate(config_data)
+
+
+@lru_cache(maxsize=4)
+def _settings_from_frozen(items: FrozenSet[Tuple[Tuple[str, str], Any]]) -> Settings:
+    """Validate flattened settings values, memoized on the values themselves"""
+    return _build_settings(items)
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value"""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _caster_for(annotation: Any) -> Callable[[str], Any]:
+    """Resolve the function converting an environment string to a field's type"""
+    # Unwrap Optional[X] to X
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if args:
+        annotation = args[0]
+    if annotation is bool:
+        return _parse_bool
+    return annotation
+
+
+def _build_env_map() -> Dict[str, Tuple[str, str, Callable[[str], Any]]]:
+    """Map each BUTTPLUG_<SECTION>_<KEY> variable to its settings field and caster"""
+    env_map = {}
+    for section, section_field in Settings.model_fields.items():
+        for key, field in section_field.annotation.model_fields.items():
+            env_map[f"BUTTPLUG_{section}_{key}".upper()] = (section, key, _caster_for(field.annotation))
+    return env_map
+
+_ENV_MAP = _build_env_map()
+_KNOWN_FIELDS = {(section, key) for section, key, _ in _ENV_MAP.values()} 
\ No newline at end of file
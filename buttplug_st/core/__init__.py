@@ -1,3 +1,11 @@
-from .device import DeviceManager, DeviceInfo
+from .._lazy import lazy_getattr
 
-__all__ = ["DeviceManager", "DeviceInfo"] 
\ No newline at end of file
+__all__ = ["DeviceManager", "DeviceInfo", "CommandBatcher"]
+
+# Imported on first access so buttplug_st.core.commands can be used without
+# loading the device manager and its settings
+__getattr__ = lazy_getattr(globals(), {
+    "DeviceManager": ".device",
+    "DeviceInfo": ".device",
+    "CommandBatcher": ".commands",
+})
\ No newline at end of file
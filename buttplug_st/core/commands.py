@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from buttplug import ConnectorError
+
+logger = logging.getLogger(__name__)
+
+class CommandBatcher:
+    """Coalesces bursts of vibrate commands and owns the timed stop that follows them"""
+
+    def __init__(self, window: float,
+                 on_connection_lost: Optional[Callable[[], Awaitable[None]]] = None):
+        self._window = window  # seconds
+        self._on_connection_lost = on_connection_lost
+        self._pending: Optional[Tuple[Any, float, Optional[float], float]] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._stop_handle: Optional[asyncio.TimerHandle] = None
+        # Held so the event loop can't garbage-collect a stop in flight
+        self._stop_task: Optional[asyncio.Task] = None
+
+    def submit(self, actuator: Any, speed: float, position: Optional[float] = None,
+               duration: float = 0) -> None:
+        """Queue a vibrate command; only the latest one in the batch window is sent"""
+        self._pending = (actuator, speed, position, duration)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush())
+
+    def cancel(self) -> None:
+        """Drop the queued command and any pending timed stop"""
+        self._pending = None
+        self._cancel_stop_timer()
+        if self._stop_task is not None:
+            self._stop_task.cancel()
+            self._stop_task = None
+
+    def close(self) -> None:
+        """Cancel everything, including a send in flight"""
+        self.cancel()
+        if self._flusher is not None and not self._flusher.done():
+            self._flusher.cancel()
+
+    async def _flush(self) -> None:
+        """Send the most recent pending command after the batch window"""
+        await asyncio.sleep(self._window)
+
+        # Commands queued while a send is in flight are picked up here
+        while self._pending is not None:
+            actuator, speed, position, duration = self._pending
+            self._pending = None
+
+            try:
+                if position is None:
+                    await actuator.command(speed)
+                else:
+                    # Try sending both speed and position if supported
+                    try:
+                        await actuator.command(speed, position)
+                    except TypeError:
+                        # Fallback: send only speed if position is not supported
+                        await actuator.command(speed)
+                logger.debug("Vibrate command sent")
+            except ConnectorError as e:
+                # The request already returned; nothing queued can be delivered
+                logger.error(f"Error sending vibrate command: {e}")
+                self._pending = None
+                if self._on_connection_lost is not None:
+                    await self._on_connection_lost()
+                return
+            except Exception as e:
+                logger.error(f"Error sending vibrate command: {e}")
+                continue
+
+            # A new command always replaces the previous stop timer
+            self._cancel_stop_timer()
+            if duration > 0:
+                self._stop_handle = asyncio.get_running_loop().call_later(
+                    duration, self._on_stop_timer, actuator, duration
+                )
+
+    def _cancel_stop_timer(self) -> None:
+        """Cancel the pending timed stop, if any"""
+        if self._stop_handle is not None:
+            self._stop_handle.cancel()
+            self._stop_handle = None
+
+    def _on_stop_timer(self, actuator: Any, duration: float) -> None:
+        """Timer callback that stops the actuator once the duration elapses"""
+        self._stop_handle = None
+        self._stop_task = asyncio.create_task(self._stop_actuator(actuator, duration))
+
+    async def _stop_actuator(self, actuator: Any, duration: float) -> None:
+        """Stop actuator after specified duration"""
+        try:
+            await actuator.command(0)
+            logger.info("Stopped vibration after %s seconds", duration)
+        except Exception as e:
+            logger.error(f"Error stopping vibration: {e}")
\ No newline at end of file
@@ -1,8 +1,8 @@
 import asyncio
 import logging
+import random
 import time
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple
 from buttplug.client import (
     Client as ButtplugClient,
     Device as ButtplugClientDevice
@@ -11,7 +11,10 @@ from buttplug import ConnectorError
 from buttplug.connectors import WebsocketConnector
 
 from ..config import Settings
+from ..utils.validators import clamp01
+from .commands import CommandBatcher
 from .exceptions import (
+    ButtplugSTException,
     DeviceNotFoundError,
     DeviceConnectionError,
     IntifaceConnectionError,
@@ -20,26 +23,50 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class DeviceInfo:
+# Actuator class -> type name, filled lazily as new classes are seen
+_ACTUATOR_TYPE_NAMES: Dict[type, str] = {}
+
+def _actuator_type_name(actuator: Any) -> str:
+    """Get the type name of an actuator, cached per class"""
+    actuator_cls = type(actuator)
+    name = _ACTUATOR_TYPE_NAMES.get(actuator_cls)
+    if name is None:
+        name = _ACTUATOR_TYPE_NAMES.setdefault(actuator_cls, actuator_cls.__name__)
+    return name
+
+class DeviceInfo(NamedTuple):
     """Information about a connected device"""
     id: str
     name: str
     index: int
     actuator_count: int
-    actuator_types: List[str]
+    actuator_types: Tuple[str, ...]
 
 class DeviceManager:
     """Manages connections to buttplug devices"""
     
     def __init__(self, settings: Settings):
         self.settings = settings
+        # Each connection gets a fresh client and connector (see _new_client)
         self._client: Optional[ButtplugClient] = None
+        self._connector: Optional[WebsocketConnector] = None
         self._devices: List[ButtplugClientDevice] = []
+        self._device_infos: List[DeviceInfo] = []
+        self._device_info_dicts: List[Dict[str, Any]] = []
         self._active_device_index: int = 0
-        self._initialized: bool = False
-        self._last_connection_attempt: float = 0
-        self._connection_retry_delay: float = 5.0  # seconds
+        self._last_scan_time: float = 0
+        self._scan_lock = asyncio.Lock()
+        self._scan_task: Optional[asyncio.Task] = None
+        self._scanning: bool = False
+        self._ready = asyncio.Event()
+        self._init_lock = asyncio.Lock()
+        self._min_reconnect_delay: float = 1.0  # seconds
+        self._max_reconnect_delay: float = 30.0  # seconds
+        self._reconnect_delay: float = self._min_reconnect_delay
+        self._reconnect_handle: Optional[asyncio.TimerHandle] = None
+        self._commands = CommandBatcher(0.01, on_connection_lost=self._handle_connection_lost)
+        self._status_snapshot: Dict[str, Any] = {}
+        self._refresh_status()
     
     @property
     def active_device(self) -> Optional[ButtplugClientDevice]:
@@ -51,7 +78,8 @@ class DeviceManager:
     @property
     def is_connected(self) -> bool:
         """Check if the client is connected to the server"""
-        return self._client is not None and self._client.connected
+        # There is no connector before the first connect
+        return self._connector is not None and self._connector.connected
     
     @property
     def has_devices(self) -> bool:
@@ -59,83 +87,183 @@ class DeviceManager:
         return len(self._devices) > 0
     
     async def initialize(self) -> None:
-        """Initialize the Buttplug client and scan for devices"""
+        """Connect the Buttplug client and start background device scanning"""
         logger.info("Initialize called")
         
-        # If already initialized and connected, just return
-        if self._initialized and self.is_connected:
-            logger.info("Already initialized and connected")
+        # Concurrent callers wait for the first attempt instead of racing it
+        async with self._init_lock:
+            # If already initialized and connected, just return
+            if self._ready.is_set() and self.is_connected:
+                logger.info("Already initialized and connected")
+                return
+            
+            try:
+                if not self.is_connected:
+                    # Devices from a dropped connection are no longer valid
+                    self._set_devices([])
+                    self._ready.clear()
+                    await self._new_client()
+                    
+                    logger.info(f"Connecting to {self.settings.websocket.url}")
+                    await self._client.connect(self._connector)
+                    logger.info(f"Connected to Intiface at {self.settings.websocket.url}")
+                
+                # Devices Intiface already knows about are listed on connect;
+                # anything else is picked up by the background scan
+                if not self._scanning:
+                    self._set_devices(list(self._client.devices.values()))
+                if self._scan_task is None or self._scan_task.done():
+                    self._scan_task = asyncio.create_task(self._periodic_scan())
+                self._ready.set()
+                self._reconnect_delay = self._min_reconnect_delay
+                if self._reconnect_handle is not None:
+                    self._reconnect_handle.cancel()
+                    self._reconnect_handle = None
+            
+            except ConnectorError as e:
+                logger.error(f"Failed to connect to Intiface: {e}")
+                self._schedule_reconnect()
+                raise IntifaceConnectionError(f"Failed to connect to Intiface: {str(e)}")
+            except Exception as e:
+                logger.error(f"Initialization error: {e}")
+                self._schedule_reconnect()
+                raise DeviceConnectionError(f"Initialization error: {str(e)}")
+            finally:
+                self._refresh_status()
+    
+    async def _new_client(self) -> None:
+        """Replace the Buttplug client and its connector before connecting"""
+        # buttplug-py never forgets devices from a dropped session, so a
+        # reused client would keep listing them after a reconnect
+        if self._client is not None:
+            # Also stops the old client's keep-alive pings
+            await self._disconnect_client()
+        self._connector = WebsocketConnector(self.settings.websocket.url)
+        self._client = ButtplugClient("ButtplugST")
+    
+    async def _disconnect_client(self) -> None:
+        """Disconnect the current client, ignoring a connection that is already gone"""
+        try:
+            await self._client.disconnect()
+        except Exception as e:
+            logger.debug(f"Error disconnecting old client: {e}")
+    
+    def _schedule_reconnect(self) -> None:
+        """Schedule a reconnection attempt with exponential backoff"""
+        if self._reconnect_handle is not None:
             return
         
-        # If we recently failed to connect, don't retry too quickly
-        current_time = time.time()
-        if (self._last_connection_attempt > 0 and 
-            current_time - self._last_connection_attempt < self._connection_retry_delay):
-            logger.info(f"Connection attempt too recent, waiting {self._connection_retry_delay} seconds")
-            raise IntifaceConnectionError("Connection attempt too recent, please wait a moment")
-        
-        self._last_connection_attempt = current_time
+        delay = self._reconnect_delay
+        self._reconnect_delay = min(delay * 2, self._max_reconnect_delay)
+        logger.info(f"Retrying connection to Intiface in {delay} seconds")
+        self._reconnect_handle = asyncio.get_running_loop().call_later(delay, self._try_reconnect)
+    
+    def _try_reconnect(self) -> None:
+        """Timer callback that starts a reconnection attempt"""
+        self._reconnect_handle = None
+        asyncio.create_task(self._reconnect())
+    
+    async def _reconnect(self) -> None:
+        """Attempt to reconnect; failures are logged and rescheduled by initialize"""
+        try:
+            await self.initialize()
+        except ButtplugSTException:
+            pass
+    
+    async def _handle_connection_lost(self) -> None:
+        """Drop a dead connection and schedule a reconnect"""
+        if self._ready.is_set():
+            logger.warning("Connection to Intiface lost")
+        self._ready.clear()
         
-        # If we have a client but it's disconnected, clean it up
-        if self._client and not self._client.connected:
-            logger.info("Client exists but disconnected, cleaning up")
-            self._client = None
-            self._devices = []
-            self._initialized = False
+        # A cleanly closed socket leaves the connector reporting connected
+        if self.is_connected:
+            await self._disconnect_client()
         
-        try:
-            logger.info("Creating new client")
-            self._client = ButtplugClient("ButtplugST")
-            connector = WebsocketConnector(self.settings.websocket.url)
-            
-            logger.info(f"Connecting to {self.settings.websocket.url}")
-            await self._client.connect(connector)
-            logger.info(f"Connected to Intiface at {self.settings.websocket.url}")
-            
-            # Scan for devices
-            await self.scan_devices()
-            self._initialized = True
+        self._refresh_status()
+        self._schedule_reconnect()
+    
+    async def _periodic_scan(self) -> None:
+        """Scan for devices in the background while connected"""
+        while self.is_connected:
+            try:
+                await self.scan_devices()
+            except ButtplugSTException:
+                # Already logged by scan_devices
+                pass
             
-        except ConnectorError as e:
-            logger.error(f"Failed to connect to Intiface: {e}")
-            raise IntifaceConnectionError(f"Failed to connect to Intiface: {str(e)}")
-        except Exception as e:
-            logger.error(f"Initialization error: {e}")
-            raise DeviceConnectionError(f"Initialization error: {str(e)}")
+            # Jitter the interval so scans don't line up with client polling
+            interval = self.settings.websocket.scan_interval
+            await asyncio.sleep(interval * random.uniform(0.8, 1.2))
+        
+        logger.info("Not connected to Intiface, stopping background scan")
+        await self._handle_connection_lost()
     
     async def scan_devices(self) -> List[DeviceInfo]:
         """Scan for devices and update the device list"""
         logger.info("Scan devices called")
         
-        if not self._client:
-            logger.error("Client is None, cannot scan")
-            raise IntifaceConnectionError("Client not initialized")
-            
-        if not self._client.connected:
+        if not self.is_connected:
             logger.error("Client not connected, cannot scan")
             raise IntifaceConnectionError("Not connected to Intiface")
+        
+        # Background and on-demand scans share the client's scanner
+        async with self._scan_lock:
+            self._scanning = True
+            self._refresh_status()
             
-        try:
-            logger.info("Scanning for devices...")
-            await self._client.start_scanning()
-            await asyncio.sleep(self.settings.websocket.scan_timeout)
-            await self._client.stop_scanning()
-            
-            self._devices = self._client.devices
-            logger.info(f"Found {len(self._devices)} devices")
-            
-            if not self._devices:
-                return []
+            try:
+                logger.info("Scanning for devices...")
+                await self._client.start_scanning()
+                try:
+                    await asyncio.sleep(self.settings.websocket.scan_timeout)
+                except asyncio.CancelledError:
+                    # Cancelled mid-scan (e.g. by shutdown); don't leave Intiface scanning
+                    try:
+                        await self._client.stop_scanning()
+                    except Exception as e:
+                        logger.warning(f"Failed to stop scanning: {e}")
+                    raise
+                await self._client.stop_scanning()
                 
-            # Reset active device index
-            self._active_device_index = 0
-            
-            # Return device info
-            return [self._get_device_info(i) for i in range(len(self._devices))]
-            
-        except Exception as e:
-            logger.error(f"Error scanning for devices: {e}")
-            raise DeviceConnectionError(f"Error scanning for devices: {str(e)}")
+                self._set_devices(list(self._client.devices.values()))
+                self._last_scan_time = time.monotonic()
+                logger.info(f"Found {len(self._devices)} devices")
+                
+                # Keep the selected device unless it went away
+                if self._active_device_index >= len(self._devices):
+                    self._active_device_index = 0
+                
+                # Return cached device info
+                return self._device_infos
+                
+            except ConnectorError as e:
+                logger.error(f"Error scanning for devices: {e}")
+                await self._handle_connection_lost()
+                raise IntifaceConnectionError(f"Lost connection to Intiface: {str(e)}")
+            except Exception as e:
+                logger.error(f"Error scanning for devices: {e}")
+                raise DeviceConnectionError(f"Error scanning for devices: {str(e)}")
+            finally:
+                self._scanning = False
+                self._refresh_status()
+    
+    async def scan_devices_if_stale(self, max_age: float = 10.0) -> List[DeviceInfo]:
+        """Scan for devices only if the last scan is older than max_age seconds"""
+        # A scan already in progress leaves fresh results behind
+        if self._scan_lock.locked():
+            async with self._scan_lock:
+                pass
+        
+        if self._last_scan_time > 0 and time.monotonic() - self._last_scan_time < max_age:
+            return self._device_infos
+        return await self.scan_devices()
+    
+    def _set_devices(self, devices: List[ButtplugClientDevice]) -> None:
+        """Replace the device list and rebuild the cached device info"""
+        self._devices = devices
+        self._device_infos = [self._get_device_info(i) for i in range(len(devices))]
+        self._device_info_dicts = [info._asdict() for info in self._device_infos]
     
     def _get_device_info(self, index: int) -> DeviceInfo:
         """Get information about a device at the specified index"""
@@ -143,10 +271,7 @@ class DeviceManager:
             raise DeviceNotFoundError(f"Device index {index} out of range")
             
         device = self._devices[index]
-        actuator_types = []
-        
-        for actuator in device.actuators:
-            actuator_types.append(str(type(actuator).__name__))
+        actuator_types = tuple(_actuator_type_name(a) for a in device.actuators)
         
         return DeviceInfo(
             id=device.index,
@@ -156,15 +281,41 @@ class DeviceManager:
             actuator_types=actuator_types
         )
     
+    def _refresh_status(self) -> None:
+        """Rebuild the cached status payload after a state change"""
+        is_connected = self.is_connected
+        
+        self._status_snapshot = {
+            "status": "ok" if is_connected else "error",
+            "server_running": True,
+            "server_initialized": self._ready.is_set(),
+            "intiface_connected": is_connected,
+            "client_state": "Connected" if is_connected else "Disconnected",
+            "device_count": len(self._devices),
+            "has_devices": self.has_devices,
+            "scanning": self._scanning,
+            "websocket_url": self.settings.websocket.url,
+            "active_device": (
+                self._device_info_dicts[self._active_device_index] if self._devices else None
+            )
+        }
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get the cached status payload"""
+        # The connection can drop without any of our own state changes
+        if self._status_snapshot["intiface_connected"] != self.is_connected:
+            self._refresh_status()
+        return self._status_snapshot
+    
     def get_all_devices(self) -> List[DeviceInfo]:
         """Get information about all connected devices"""
-        return [self._get_device_info(i) for i in range(len(self._devices))]
+        return self._device_infos
     
     def get_active_device(self) -> Optional[DeviceInfo]:
         """Get information about the currently active device"""
         if not self._devices:
             return None
-        return self._get_device_info(self._active_device_index)
+        return self._device_infos[self._active_device_index]
     
     def set_active_device(self, index: int) -> DeviceInfo:
         """Set the active device by index"""
@@ -172,7 +323,8 @@ class DeviceManager:
             raise DeviceNotFoundError(f"Device index {index} out of range")
             
         self._active_device_index = index
-        return self._get_device_info(index)
+        self._refresh_status()
+        return self._device_infos[index]
     
     async def vibrate(self, speed: float, position: Optional[float] = None, 
                       duration: float = 0) -> Dict[str, Any]:
@@ -181,63 +333,41 @@ class DeviceManager:
         if not device or not device.actuators:
             raise DeviceNotFoundError()
         
-        try:
-            # Clamp values
-            speed = max(0.0, min(1.0, speed))
-            if position is not None:
-                position = max(0.0, min(1.0, position))
-            
-            logger.info(f"Vibrating device {device.name} at {speed*100:.0f}% power")
-            
-            # Get the first actuator (usually the vibration motor)
-            actuator = device.actuators[0]
+        # Clamp values
+        speed = clamp01(speed)
+        if position is not None:
+            position = clamp01(position)
+        
+        logger.debug("Vibrating device %s at %.0f%% power", device.name, speed * 100)
+        
+        # Get the first actuator (usually the vibration motor)
+        actuator = device.actuators[0]
+        
+        # Bursts within the batch window are coalesced; only the latest is sent
+        self._commands.submit(actuator, speed, position, duration)
             
-            # Try sending both speed and position if supported
-            try:
-                if position is not None:
-                    await actuator.command(speed, position)
-                else:
-                    await actuator.command(speed)
-            except TypeError:
-                # Fallback: send only speed if position is not supported
-                await actuator.command(speed)
-                
-            # If duration specified, schedule stop
-            if duration > 0:
-                asyncio.create_task(self._stop_after_delay(actuator, duration))
-                
-            result = {
-                "success": True,
-                "device": device.name,
-                "speed": speed,
-            }
+        result = {
+            "success": True,
+            "device": device.name,
+            "speed": speed,
+        }
+        
+        if position is not None:
+            result["position"] = position
             
-            if position is not None:
-                result["position"] = position
-                
-            if duration > 0:
-                result["duration"] = duration
-                
-            return result
+        if duration > 0:
+            result["duration"] = duration
             
-        except Exception as e:
-            logger.error(f"Error sending vibrate command: {e}")
-            raise CommandError(f"Error sending vibrate command: {str(e)}")
-    
-    async def _stop_after_delay(self, actuator, duration: float) -> None:
-        """Stop actuator after specified duration"""
-        await asyncio.sleep(duration)
-        try:
-            await actuator.command(0)
-            logger.info(f"Stopped vibration after {duration} seconds")
-        except Exception as e:
-            logger.error(f"Error stopping vibration: {e}")
+        return result
     
     async def stop(self) -> Dict[str, Any]:
         """Stop all actuators on the active device"""
         device = self.active_device
         if not device:
             raise DeviceNotFoundError()
+        
+        # Drop any queued vibrate command so it can't restart the device
+        self._commands.cancel()
             
         try:
             await device.stop()
@@ -254,8 +384,20 @@ class DeviceManager:
         """Disconnect from all devices and shutdown client"""
         logger.info("Shutdown called")
         
+        # Stop retrying the connection and scanning for devices
+        if self._reconnect_handle is not None:
+            self._reconnect_handle.cancel()
+            self._reconnect_handle = None
+        if self._scan_task is not None and not self._scan_task.done():
+            self._scan_task.cancel()
+            # Let a scan in progress send StopScanning before we disconnect
+            await asyncio.gather(self._scan_task, return_exceptions=True)
+        
+        # Discard queued commands
+        self._commands.close()
+        
         # First stop all devices if possible
-        if self._client and self._client.connected and self._devices:
+        if self.is_connected and self._devices:
             try:
                 logger.info("Stopping all devices before shutdown")
                 for device in self._devices:
@@ -267,14 +409,14 @@ class DeviceManager:
                 logger.warning(f"Error stopping devices during shutdown: {e}")
         
         # Then disconnect
-        if self._client and self._client.connected:
+        if self.is_connected:
             try:
                 await self._client.disconnect()
                 logger.info("Disconnected from Intiface")
             except Exception as e:
                 logger.error(f"Error during client disconnect: {e}")
         
-        self._client = None
-        self._devices = []
-        self._initialized = False
+        self._set_devices([])
+        self._ready.clear()
+        self._refresh_status()
         logger.info("Shutdown complete") 
\ No newline at end of file
@@ -18,10 +18,27 @@ class ButtplugSTException(Exception):
             self.code = code
         if status_code:
             self.status_code = status_code
+        self._using_defaults = not (detail or code or status_code)
         super().__init__(self.detail)
     
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._cached_dict = cls._build_dict()
+    
+    @classmethod
+    def _build_dict(cls) -> Dict[str, Any]:
+        """Build the response dictionary for the class-level defaults"""
+        return {
+            "error": cls.code,
+            "detail": cls.detail,
+            "status_code": cls.status_code
+        }
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for API responses"""
+        if self._using_defaults:
+            # Copied so callers can't change the shared class-level dict
+            return dict(self._cached_dict)
         return {
             "error": self.code,
             "detail": self.detail,
@@ -29,6 +46,9 @@ class ButtplugSTException(Exception):
         }
 
 
+ButtplugSTException._cached_dict = ButtplugSTException._build_dict()
+
+
 class DeviceNotFoundError(ButtplugSTException):
     """Exception raised when no device is found or connected"""
     status_code = 404
@@ -0,0 +1,19 @@
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop's event loop policy when uvloop is installed
+
+    Must be called before the event loop is created. uvloop is not
+    available on Windows, where the default asyncio loop is kept.
+
+    Returns:
+        True if the uvloop policy was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
\ No newline at end of file
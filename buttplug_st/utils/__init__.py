@@ -1,3 +1,12 @@
-from .validators import validate_float_range
+from .._lazy import lazy_getattr
 
-__all__ = ["validate_float_range"] 
\ No newline at end of file
+__all__ = ["validate_float_range", "clamp01", "parse_float", "parse_bool", "OrjsonProvider"]
+
+# Imported on first access so the validators can be used without orjson
+__getattr__ = lazy_getattr(globals(), {
+    "validate_float_range": ".validators",
+    "clamp01": ".validators",
+    "parse_float": ".validators",
+    "parse_bool": ".validators",
+    "OrjsonProvider": ".json_provider",
+})
\ No newline at end of file
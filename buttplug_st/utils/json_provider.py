@@ -0,0 +1,15 @@
+from typing import Any
+
+import orjson
+from quart.json.provider import DefaultJSONProvider
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson"""
+    
+    def dumps(self, object_: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON using orjson"""
+        return orjson.dumps(object_, default=self.default).decode()
+    
+    def loads(self, object_: Any, **kwargs: Any) -> Any:
+        """Deserialize JSON data using orjson"""
+        return orjson.loads(object_)
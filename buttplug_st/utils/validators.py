@@ -1,6 +1,45 @@
+import math
 from typing import Optional, Any, Dict
 from ..core.exceptions import ValidationError
 
+_RANGE_MSG = "Parameter '{}' must be between {} and {}, got {}"
+
+# Accepted spellings for boolean query parameters
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+_FALSE_VALUES = frozenset(("0", "false", "no", "off", ""))
+
+# Shared default for extract_query_params; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+def clamp01(value: float) -> float:
+    """Clamp a value to the [0.0, 1.0] range; NaN clamps to 0.0"""
+    # "not >=" rather than "<" so NaN, which fails every comparison, can't pass
+    return 0.0 if not value >= 0.0 else (1.0 if value > 1.0 else value)
+
+def parse_float(value: Optional[str], default: Optional[float], param_name: str = "value") -> Optional[float]:
+    """Parse an optional query parameter as a float, rejecting malformed and non-finite input"""
+    if value is None:
+        return default
+    try:
+        float_val = float(value)
+    except ValueError:
+        raise ValidationError(f"Parameter '{param_name}' must be a number")
+    # float() accepts "nan" and "inf"; neither is a usable speed or duration
+    if not math.isfinite(float_val):
+        raise ValidationError(f"Parameter '{param_name}' must be a finite number")
+    return float_val
+
+def parse_bool(value: Optional[str], default: bool, param_name: str = "value") -> bool:
+    """Parse an optional query parameter as a boolean, rejecting unrecognised input"""
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValidationError(f"Parameter '{param_name}' must be a boolean")
+
 def validate_float_range(
     value: Any,
     min_val: float = 0.0,
@@ -8,29 +47,26 @@ def validate_float_range(
     param_name: str = "value"
 ) -> float:
     """Validate that a value is a float within the specified range"""
-    try:
+    # Fast paths: callers usually pass floats or ints already
+    if type(value) is float:
+        float_val = value
+    elif type(value) is int:
         float_val = float(value)
-    except (TypeError, ValueError):
-        raise ValidationError(f"Parameter '{param_name}' must be a number")
+    else:
+        try:
+            float_val = float(value)
+        except (TypeError, ValueError):
+            raise ValidationError(f"Parameter '{param_name}' must be a number")
     
     if float_val < min_val or float_val > max_val:
-        raise ValidationError(
-            f"Parameter '{param_name}' must be between {min_val} and {max_val}, got {float_val}"
-        )
+        raise ValidationError(_RANGE_MSG.format(param_name, min_val, max_val, float_val))
     
     return float_val
 
 def extract_query_params(query_args: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Extract and validate query parameters with defaults"""
     if defaults is None:
-        defaults = {}
-    
-    result = {}
+        defaults = _EMPTY
     
-    for key, default_value in defaults.items():
-        if key in query_args:
-            result[key] = query_args[key]
-        else:
-            result[key] = default_value
-            
-    return result 
\ No newline at end of file
+    # Keys present in both take the query value; the intersection runs in C
+    return {**defaults, **{key: query_args[key] for key in defaults.keys() & query_args.keys()}} 
\ No newline at end of file
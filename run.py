@@ -5,30 +5,50 @@ ButtplugST launcher script
 This script launches the ButtplugST server which acts as a bridge between 
 SillyTavern and buttplug.io devices.
 """
-import asyncio
 import argparse
 import os
+import re
 import sys
 from typing import Optional, Dict, Any
 
 
+# Hostname, IPv4 address or bracketless IPv6 address
+_HOST_RE = re.compile(r"^(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)*|[0-9A-Fa-f:.]*:[0-9A-Fa-f:.]*)$")
+
+
+def _port(value: str) -> int:
+    """Parse a TCP port number for argparse"""
+    try:
+        port = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid port: {value!r}")
+    if not 1 <= port <= 65535:
+        raise argparse.ArgumentTypeError(f"port must be between 1 and 65535, got {port}")
+    return port
+
+
+def _host(value: str) -> str:
+    """Parse a hostname or IP address for argparse"""
+    if len(value) > 253 or not _HOST_RE.match(value):
+        raise argparse.ArgumentTypeError(f"invalid host: {value!r}")
+    return value
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments for ButtplugST server"""
     parser = argparse.ArgumentParser(
         description='ButtplugST - Bridge between SillyTavern and buttplug.io'
     )
     parser.add_argument('--config', '-c', help='Path to config file')
-    parser.add_argument('--host', '-H', help='Server host')
-    parser.add_argument('--port', '-p', type=int, help='Server port')
+    parser.add_argument('--host', '-H', type=_host, help='Server host')
+    parser.add_argument('--port', '-p', type=_port, help='Server port')
     parser.add_argument('--debug', '-d', action='store_true', help='Enable debug mode')
     parser.add_argument('--websocket', '-w', help='Intiface websocket URL')
     return parser.parse_args()
 
 
-async def main() -> None:
+def main(args: argparse.Namespace) -> None:
     """Main entry point for the application"""
-    args = parse_args()
-    
     # Set environment variables from command line args
     if args.host:
         os.environ['BUTTPLUG_SERVER_HOST'] = args.host
@@ -40,8 +60,13 @@ async def main() -> None:
         os.environ['BUTTPLUG_WEBSOCKET_URL'] = args.websocket
     
     # Import here to respect environment variables
-    from buttplug_st.config import Settings
-    from buttplug_st.app import main as app_main
+    import asyncio
+    try:
+        from buttplug_st.config import Settings
+        from buttplug_st.app import main as app_main
+        from buttplug_st.event_loop import install_uvloop
+    except ImportError as e:
+        sys.exit(f"Failed to import ButtplugST ({e}). Install dependencies with: pip install -r requirements.txt")
     
     settings = Settings.load(config_path=args.config if args.config else None)
     
@@ -49,12 +74,16 @@ async def main() -> None:
     print(f"Connecting to Intiface at {settings.websocket.url}")
     print("Press Ctrl+C to exit")
     
-    await app_main()
+    install_uvloop()
+    asyncio.run(app_main(settings))
 
 
 if __name__ == "__main__":
+    # Parse arguments first so --help and usage errors skip the heavy imports
+    args = parse_args()
+    
     try:
-        asyncio.run(main())
+        main(args)
     except KeyboardInterrupt:
         print("\nExiting...")
         sys.exit(0) 
\ No newline at end of file